@@ -1,141 +1,336 @@
-from decimal import Decimal, getcontext
-from stabilze import stabilize
-from condint import condint, condint_list
-from maths_cleaned import _to_decimal, dec_div
+from decimal import Decimal
+from itertools import accumulate, islice
+from operator import add, mul, sub
+from stabilze import _no_cache
+from condint import _make_convert, condint_list
+from maths_cleaned import ZERO, _int_to_decimal, _to_decimal, dec_div
+
+try:  # NumPy is optional: only needed for backend="float"
+    import numpy as np
+except ImportError:
+    np = None
+
+BACKENDS = ("decimal", "float")
+
+
+def _check_backend(backend):
+    """Validate a backend name, making sure NumPy is there for 'float'."""
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend {backend!r}. Please use 'decimal' or 'float'.")
+    if backend == "float" and np is None:
+        raise ImportError("backend='float' needs NumPy. Please install it or use backend='decimal'.")
+    return backend
+
+
+def _flatten(data, ndim):
+    """Flatten an ndim-deep nested list. Returns (flat_list, shape)."""
+    flat = list(data)
+    shape = [len(flat)]
+    for _ in range(ndim - 1):
+        n = len(flat[0]) if flat else 0
+        if any(len(part) != n for part in flat):
+            raise ValueError("Nested lists must all have the same length")
+        shape.append(n)
+        flat = [v for part in flat for v in part]
+    return flat, tuple(shape)
+
+
+def _nest(flat, shape):
+    """Rebuild nested lists of the given shape from a flat list."""
+    if len(shape) <= 1:
+        return flat
+    step = len(flat) // shape[0] if shape[0] else 0
+    return [_nest(flat[i*step:(i+1)*step], shape[1:]) for i in range(shape[0])]
+
+
+def _float_div(a, b, out=None):
+    """Element-wise division for float arrays with the same zero check as dec_div."""
+    if np.any(np.asarray(b) == 0):
+        raise ValueError("Cannot divide by zero. Please change.")
+    return np.true_divide(a, b, out=out)
+
+
+# NumPy counterparts of the Decimal element-wise ops, for backend="float"
+_FLOAT_OPS = {} if np is None else {
+    add: np.add, sub: np.subtract, mul: np.multiply, dec_div: _float_div,
+}
 
 # ───────────── Array Base Class ─────────────
-getcontext().prec = 1000  # High precision for calculations
 class BaseArray:
-    def __init__(self, data, *, to_type=None, cond=None):
-        # convert all input to Decimal safely
-        self.data = [_to_decimal(x) for x in data]
-        self.to_type = to_type
-        self.cond = cond
+    backend = "decimal"
+
+    def __init__(self, data, *, to_type=None, cond=None, backend="decimal"):
+        self.backend = _check_backend(backend)
+        if backend == "float":
+            # one contiguous float64 buffer, math runs as NumPy ufuncs
+            # list() first so generators work; np.array always copies
+            self.data = np.array(list(data), dtype=np.float64)
+            if self.data.ndim != 1:
+                raise ValueError("Expected a flat sequence of numbers; use Array2/Array3 for nested data")
+        else:
+            # convert all input to Decimal safely
+            self.data = [_to_decimal(x) for x in data]
+        self.shape = (len(self.data),)
+        self._to_type = to_type
+        self._cond = cond
+        self._build_convert()
+
+    # changing to_type/cond rebuilds the element converter
+    @property
+    def to_type(self):
+        return self._to_type
+
+    @to_type.setter
+    def to_type(self, value):
+        self._to_type = value
+        self._build_convert()
+
+    @property
+    def cond(self):
+        return self._cond
+
+    @cond.setter
+    def cond(self, value):
+        self._cond = value
+        self._build_convert()
+
+    def _build_convert(self):
+        # Decimal storage only ever holds Decimals, so skip the other type checks
+        self._convert = _make_convert(self._to_type, self._cond, decimal=self.backend == "decimal")
+
+    def _scalar(self, x):
+        """Convert a single value to this array's storage type."""
+        return float(x) if self.backend == "float" else _to_decimal(x)
+
+    def _operand(self, x):
+        """_scalar for an arithmetic operand; repeated int operands are memoized."""
+        if self.backend == "decimal" and isinstance(x, int):
+            return _int_to_decimal(x)
+        return self._scalar(x)
+
+    def _convert_all(self, values):
+        """Convert a run of values (Decimal iterable or float64 ndarray)."""
+        if self.backend == "float":
+            # vectorized exact-int test instead of one call per element
+            return condint_list(values, to_type=self.to_type, cond=self.cond)
+        convert = self._convert
+        return [convert(x) for x in values]
 
     def __repr__(self):
-        return f"{self.__class__.__name__}({[condint(x, to_type=self.to_type, cond=self.cond) for x in self.data]})"
+        return f"{self.__class__.__name__}({self.to_list()})"
 
     def __len__(self):
         return len(self.data)
 
     def __getitem__(self, idx):
-        return condint(self.data[idx], to_type=self.to_type, cond=self.cond)
+        if isinstance(idx, slice):
+            return self._convert_all(self.data[idx])
+        x = self.data[idx]
+        if self.backend == "float":
+            x = x.item()
+        return self._convert(x)
 
     def __setitem__(self, idx, value):
-        self.data[idx] = _to_decimal(value)
+        self.data[idx] = self._scalar(value)
 
     def to_list(self):
-        return [condint(x, to_type=self.to_type, cond=self.cond) for x in self.data]
+        return _nest(self._convert_all(self.data), self.shape)
 
 # ───────────── Element-wise Operations ─────────────
-    def _elementwise(self, other, op):
+    def _check_out(self, out):
+        """out must share this array's backend and element count."""
+        if not isinstance(out, BaseArray) or out.backend != self.backend or len(out.data) != len(self.data):
+            raise ValueError("out must be an array with the same backend and number of elements")
+
+    def _elementwise_convert(self, other, op, out=None):
+        """
+        Apply op element-wise and condint each result in the same pass.
+        With out=, the raw results are written into out.data instead and
+        out is returned (see the aliasing note below).
+        """
         if isinstance(other, BaseArray):
-            if len(self.data) != len(other.data):
-                raise ValueError("Array lengths must match")
-            return [op(a, b) for a, b in zip(self.data, other.data)]
+            if self.shape != other.shape:
+                raise ValueError("Array shapes must match")
+            if self.backend == "float":
+                o = np.asarray(other.data, dtype=np.float64)
+            else:
+                o = other.data if other.backend == "decimal" else [_to_decimal(b) for b in other.data]
         else:  # scalar
-            o = _to_decimal(other)
-            return [op(a, o) for a in self.data]
+            o = self._operand(other)
+        if out is not None:
+            self._check_out(out)
+
+        if self.backend == "float":
+            # a single ufunc call over the whole buffer
+            if out is not None:
+                _FLOAT_OPS[op](self.data, o, out=out.data)
+                return out
+            return _nest(self._convert_all(_FLOAT_OPS[op](self.data, o)), self.shape)
+
+        if isinstance(other, BaseArray):
+            values = map(op, self.data, o)
+        else:
+            values = (op(a, o) for a in self.data)
+        if out is not None:
+            out.data[:] = list(values)  # built in full before out is touched
+            return out
+        return _nest(self._convert_all(values), self.shape)
 
 # ───────────── Arithmetic ─────────────
-    @stabilize
-    def add(self, other):
-        return condint_list(self._elementwise(other, lambda a, b: a+b),
-                            to_type=self.to_type, cond=self.cond)
-
-    @stabilize
-    def sub(self, other):
-        return condint_list(self._elementwise(other, lambda a, b: a-b),
-                            to_type=self.to_type, cond=self.cond)
-
-    @stabilize
-    def mul(self, other):
-        return condint_list(self._elementwise(other, lambda a, b: a*b),
-                            to_type=self.to_type, cond=self.cond)
-
-    @stabilize
-    def div(self, other):
-        return condint_list(self._elementwise(other, dec_div),
-                            to_type=self.to_type, cond=self.cond)
+# out= (optional): an existing array with the same backend and number of
+# elements. The result is stored in it and it is returned, so hot loops like
+# `pos.add(vel, out=pos)` reuse one buffer. out may be self or other.
+    @_no_cache
+    def add(self, other, out=None):
+        return self._elementwise_convert(other, add, out)
+
+    @_no_cache
+    def sub(self, other, out=None):
+        return self._elementwise_convert(other, sub, out)
+
+    @_no_cache
+    def mul(self, other, out=None):
+        return self._elementwise_convert(other, mul, out)
+
+    @_no_cache
+    def div(self, other, out=None):
+        return self._elementwise_convert(other, dec_div, out)
     
 # ───────────── Vectorized Math Helpers ─────────────
-    @stabilize
+    @_no_cache
     def sum(self):
-        return condint(sum(self.data), to_type=self.to_type, cond=self.cond)
+        total = self.data.sum().item() if self.backend == "float" else sum(self.data, ZERO)
+        return self._convert(total)
 
-    @stabilize
+    @_no_cache
     def mean(self):
         if len(self.data) == 0:
             raise ValueError("Cannot compute mean of empty array")
-        return condint(dec_div(sum(self.data), len(self.data)), to_type=self.to_type, cond=self.cond)
-
-    @stabilize
-    def cumsum(self):
-        total = _to_decimal(0)
-        result = []
-        for x in self.data:
-            total += x
-            result.append(condint(total, to_type=self.to_type, cond=self.cond))
-        return result
-
-    @stabilize
+        if self.backend == "float":
+            return self._convert(self.data.mean().item())
+        return self._convert(dec_div(sum(self.data), len(self.data)))
+
+    @_no_cache
+    def cumsum(self, out=None):
+        if out is not None:
+            self._check_out(out)
+        if self.backend == "float":
+            if out is not None:
+                np.cumsum(self.data, out=out.data)
+                return out
+            return self._convert_all(np.cumsum(self.data))
+        # accumulate/map/sum loop in C instead of Python bytecode; starting
+        # from ZERO rounds every running total (the first one too) like sum()
+        totals = islice(accumulate(self.data, add, initial=ZERO), 1, None)
+        if out is not None:
+            out.data[:] = list(totals)
+            return out
+        return self._convert_all(totals)
+
+    @_no_cache
     def dot(self, other):
         if not isinstance(other, BaseArray) or len(other.data) != len(self.data):
             raise ValueError("Dot product requires arrays of same length")
-        total = sum(a*b for a, b in zip(self.data, other.data))
-        return condint(total, to_type=self.to_type, cond=self.cond)
+        if self.backend == "float":
+            total = np.dot(self.data, np.asarray(other.data, dtype=np.float64)).item()
+        else:
+            o = other.data if other.backend == "decimal" else [_to_decimal(b) for b in other.data]
+            total = sum(map(mul, self.data, o), ZERO)
+        return self._convert(total)
 
 # ───────────── Array1, Array2, Array3 ─────────────
 class Array1(BaseArray):
-    """1D array wrapper with Decimal-safe operations."""
-    def __init__(self, data, *, to_type=None, cond=None):
-        self.data = [_to_decimal(v) for v in data]
-        self.to_type = to_type
-        self.cond = cond
+    """1D array wrapper with Decimal-safe operations.
 
-    def __getitem__(self, idx):
-        return condint(self.data[idx], to_type=self.to_type, cond=self.cond)
+    backend="decimal" (default) keeps exact Decimal values.
+    backend="float" stores a NumPy float64 buffer for speed (needs NumPy).
+    """
+    def __init__(self, data, *, to_type=None, cond=None, backend="decimal"):
+        super().__init__(data, to_type=to_type, cond=cond, backend=backend)
 
-    def __setitem__(self, idx, value):
-        self.data[idx] = _to_decimal(value)
 
-    def to_list(self):
-        return [condint(x, to_type=self.to_type, cond=self.cond) for x in self.data]
+class _GridArray(BaseArray):
+    """Shared base for Array2/Array3.
 
+    Values live in one flat, row-major buffer (self.data) next to a shape
+    tuple, so element-wise math runs over a single list or ndarray and
+    indexing is plain arithmetic instead of walking nested lists.
+    """
+    ndim = 2
 
-class Array2(BaseArray):
-    """2D array wrapper. Nested lists assumed for input."""
-    def __init__(self, data, *, to_type=None, cond=None):
-        # flatten inner lists to Decimal lists
-        flattened = [[_to_decimal(v) for v in row] for row in data]
-        self.data = flattened
-        self.to_type = to_type
-        self.cond = cond
+    def __init__(self, data, *, to_type=None, cond=None, backend="decimal"):
+        flat, shape = _flatten(data, self.ndim)
+        super().__init__(flat, to_type=to_type, cond=cond, backend=backend)
+        self.shape = shape
+
+    @classmethod
+    def _from_flat(cls, flat, shape, *, to_type=None, cond=None, backend="decimal"):
+        """Wrap an already-built flat buffer (taken as-is, not copied)."""
+        arr = cls.__new__(cls)
+        arr.backend = _check_backend(backend)
+        arr.data = flat
+        arr.shape = shape
+        arr._to_type = to_type
+        arr._cond = cond
+        arr._build_convert()
+        return arr
+
+    def __len__(self):
+        return self.shape[0]
+
+    def _block(self, idx):
+        """Start/stop of the idx-th sub-block along the first axis."""
+        if idx < 0:
+            idx += self.shape[0]
+        if not 0 <= idx < self.shape[0]:
+            raise IndexError(f"{self.__class__.__name__} index out of range")
+        size = len(self.data) // self.shape[0]
+        return idx*size, (idx+1)*size
 
     def __getitem__(self, idx):
-        row = self.data[idx]
-        return [condint(x, to_type=self.to_type, cond=self.cond) for x in row]
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(self.shape[0]))]
+        start, stop = self._block(idx)
+        return _nest(self._convert_all(self.data[start:stop]), self.shape[1:])
 
     def __setitem__(self, idx, value):
-        self.data[idx] = [_to_decimal(v) for v in value]
+        start, stop = self._block(idx)
+        flat, shape = _flatten(value, self.ndim - 1)
+        if shape != self.shape[1:]:
+            raise ValueError(f"Expected shape {self.shape[1:]}, got {shape}")
+        self.data[start:stop] = [self._scalar(v) for v in flat]
 
-    def to_list(self):
-        return [[condint(x, to_type=self.to_type, cond=self.cond) for x in row] for row in self.data]
 
-class Array3(BaseArray):
-    """3D array wrapper. Nested 3-level lists assumed for input."""
-    def __init__(self, data, *, to_type=None, cond=None):
-        # flatten inner lists to Decimal lists
-        self.data = [[[ _to_decimal(v) for v in layer] for layer in matrix] for matrix in data]
-        self.to_type = to_type
-        self.cond = cond
+class Array2(_GridArray):
+    """2D array wrapper. Nested lists assumed for input."""
+    ndim = 2
 
-    def __getitem__(self, idx):
-        matrix = self.data[idx]
-        return [[condint(x, to_type=self.to_type, cond=self.cond) for x in layer] for layer in matrix]
+    def matmul(self, other):
+        """Matrix product self @ other, returned as a new Array2."""
+        if not isinstance(other, Array2):
+            raise TypeError("Matrix product needs another Array2")
+        if self.shape[1] != other.shape[0]:
+            raise ValueError("Matrix product needs an Array2 with as many rows as this one has columns")
+        rows, inner = self.shape
+        cols = other.shape[1]
+        if self.backend == "float":
+            # one BLAS call on the 2D views of both flat buffers
+            b = np.asarray(other.data, dtype=np.float64).reshape(other.shape)
+            product = (self.data.reshape(self.shape) @ b).ravel()
+        else:
+            b = other.data if other.backend == "decimal" else [_to_decimal(v) for v in other.data]
+            columns = [b[j::cols] for j in range(cols)]
+            product = [sum(map(mul, self.data[i*inner:(i+1)*inner], col), ZERO)
+                       for i in range(rows) for col in columns]
+        return Array2._from_flat(product, (rows, cols), to_type=self.to_type,
+                                 cond=self.cond, backend=self.backend)
 
-    def __setitem__(self, idx, value):
-        self.data[idx] = [[_to_decimal(v) for v in layer] for layer in value]
+    def __matmul__(self, other):
+        if not isinstance(other, Array2):
+            return NotImplemented
+        return self.matmul(other)
 
-    def to_list(self):
-        return [[[condint(x, to_type=self.to_type, cond=self.cond) for x in layer] for layer in matrix] for matrix in self.data]
\ No newline at end of file
+
+class Array3(_GridArray):
+    """3D array wrapper. Nested 3-level lists assumed for input."""
+    ndim = 3
@@ -2,6 +2,11 @@ from decimal import Decimal
 from fractions import Fraction
 from typing import Callable, Optional
 
+try:  # NumPy is optional, only used to speed up condint_list on ndarrays
+    import numpy as np
+except ImportError:
+    np = None
+
 def condint(x, *, to_type: Optional[str] = None, cond: Optional[Callable] = None):
     """
     Conditionally converts between int and float for game-safe operations.
@@ -51,6 +56,104 @@ def condint(x, *, to_type: Optional[str] = None, cond: Optional[Callable] = None
 
 def condint_list(lst, *, to_type: Optional[str] = None, cond: Optional[Callable] = None):
     """
-    Apply condint to a list of values
+    Apply condint to a list of values.
+    A float NumPy array is handled in one vectorized pass when no cond is given.
     """
+    if np is not None and isinstance(lst, np.ndarray):
+        if cond is None:
+            return _condint_ndarray(lst, to_type)
+        lst = lst.tolist()
     return [condint(x, to_type=to_type, cond=cond) for x in lst]
+
+
+def _condint_ndarray(arr, to_type):
+    """condint_list for an ndarray, returning (nested) lists of Python numbers."""
+    if arr.dtype.kind != "f":
+        return [condint(x, to_type=to_type) for x in arr.tolist()]
+    if to_type not in ('int', None):
+        return arr.tolist()  # 'float' (or unknown): values stay floats
+
+    # exact-int test for the whole array at once
+    mask = np.isfinite(arr) & (np.trunc(arr) == arr)
+    out = arr.astype(object)
+    small = mask & (np.abs(arr) < 2.0**63)
+    out[small] = arr[small].astype(np.int64).astype(object)
+    big = mask & ~small
+    if big.any():
+        out[big] = [int(v) for v in arr[big].tolist()]
+    return out.tolist()
+
+
+# ───────────── Pre-built converters ─────────────
+# Arrays convert every element with the same to_type/cond, so they pick one
+# of these once (see _make_convert) instead of re-parsing kwargs per element.
+def _to_int(x):
+    if isinstance(x, int):
+        return int(x)
+    if isinstance(x, float):
+        return int(x) if x.is_integer() else x
+    if isinstance(x, Decimal):
+        return int(x) if x == x.to_integral_value() else x
+    if isinstance(x, Fraction):
+        return x.numerator if x.denominator == 1 else x
+    return x
+
+
+def _to_float(x):
+    return float(x)
+
+
+def _auto(x):
+    if isinstance(x, float) and x.is_integer():
+        return int(x)
+    return x
+
+
+def _identity(x):
+    return x
+
+
+def _dec_to_int(x):
+    return int(x) if x == x.to_integral_value() else x
+
+
+def _condint_decimal(x, *, to_type: Optional[str] = None, cond: Optional[Callable] = None):
+    """
+    condint for a value already known to be a Decimal.
+    Skips the int/float/Fraction checks; auto mode never changes a Decimal.
+    """
+    if cond is not None and not cond(x):
+        return x
+    if to_type == 'int':
+        return _dec_to_int(x)
+    if to_type == 'float':
+        return float(x)
+    return x
+
+
+def _make_convert(to_type: Optional[str] = None, cond: Optional[Callable] = None, *, decimal: bool = False):
+    """
+    Build a one-argument function that behaves like
+    condint(x, to_type=to_type, cond=cond).
+    decimal=True: every input will be a Decimal, so the Decimal-only
+    versions are used.
+    """
+    if decimal:
+        if to_type not in ('int', 'float'):
+            return _identity
+        if cond is not None:
+            return lambda x: _condint_decimal(x, to_type=to_type, cond=cond)
+        return _dec_to_int if to_type == 'int' else _to_float
+
+    if to_type == 'int':
+        convert = _to_int
+    elif to_type == 'float':
+        convert = _to_float
+    elif to_type is None:
+        convert = _auto
+    else:
+        return _identity
+
+    if cond is None:
+        return convert
+    return lambda x: convert(x) if cond(x) else x
@@ -1,15 +1,24 @@
-from decimal import Decimal, getcontext
+import math
+from functools import lru_cache
+from decimal import Decimal, localcontext
 from fractions import Fraction
 from stabilze import stabilize
 from condint import condint
 
 # ───────────── Configuration & Constants ─────────────
-getcontext().prec = 50
+# Working precision for the Newton/series loops (sqrt, cbrt, ln, sin, cos).
+# Results are rounded back to the caller's context, so everything else runs
+# at the normal Decimal precision.
+SERIES_PREC = 60
 
 PI = Decimal("3.1415926535897932384626433832795028841971")
 E  = Decimal("2.7182818284590452353602874713527")
 ZERO = Decimal("0")
 ONE  = Decimal("1")
+TWO  = Decimal("2")
+TWO_PI = Decimal("6.2831853071795864769252867665590057683942")
+HUNDRED = Decimal("100")
+_SMALL_INTS = {0: ZERO, 1: ONE, 2: TWO}
 
 
 # ───────────── Helpers ─────────────
@@ -17,12 +26,34 @@ def _to_decimal(x):
     """Convert int | float | Decimal | Fraction -> Decimal safely."""
     if isinstance(x, Decimal):
         return x
+    elif isinstance(x, int):
+        small = _SMALL_INTS.get(x)
+        return small if small is not None else Decimal(x)
     elif isinstance(x, Fraction):
         return Decimal(x.numerator) / Decimal(x.denominator)
-    else:  # int or float
+    else:  # float
         return Decimal(x)
 
 
+@lru_cache(maxsize=4096)
+def _int_to_decimal(n):
+    """
+    Memoized Decimal(int) for scalar operands that recur (arr.mul(2) in a
+    loop). Decimal(int) is exact, so sharing one object is safe. Not used
+    for bulk element conversion, where the values are mostly distinct.
+    """
+    return Decimal(n)
+
+
+def _digit_sum(n):
+    """Sum of the decimal digits of a non-negative int."""
+    s = 0
+    while n:
+        s += n % 10
+        n //= 10
+    return s
+
+
 def dec_div(a, b):
     """Safe division with Decimal conversion and zero check."""
     a = _to_decimal(a)
@@ -33,6 +64,34 @@ def dec_div(a, b):
     return a / b
 
 
+def _cbrt_float(x):
+    """Real cube root of an int/float, exact for perfect cubes."""
+    if hasattr(math, "cbrt"):  # Python 3.11+
+        root = math.cbrt(x)
+    else:
+        root = math.copysign(abs(x) ** (1/3), x)
+        if root:
+            root -= (root*root*root - x) / (3*root*root)  # one Newton step
+    # libm can land one ulp off (cbrt(-27) -> -3.0000000000000004)
+    if math.isfinite(root):
+        nearest = round(root)
+        if nearest**3 == x:
+            return float(nearest)
+    return root
+
+
+def _use_fast(fast, *values):
+    """True when the float fast path may be used for all values."""
+    return fast and all(_float_safe(v) for v in values)
+
+
+def _float_safe(v):
+    """float, or an int small enough to convert (with room for a - b)."""
+    if isinstance(v, float):
+        return True
+    return isinstance(v, int) and abs(v) < 2**1022
+
+
 # ───────────── Basic Number Functions ─────────────
 @stabilize
 def fact(n, *, to_type=None, cond=None):
@@ -48,26 +107,28 @@ def fact(n, *, to_type=None, cond=None):
 @stabilize
 def fibonacci(n, *, to_type=None, cond=None):
     n = int(n)
-    a, b = ZERO, ONE
+    # exact Python ints while adding, Decimal only for the output
+    a, b = 0, 1
     series = []
     for _ in range(n):
         series.append(a)
         a, b = b, a + b
-    return [condint(_to_decimal(x), to_type=to_type, cond=cond) for x in series]
+    if to_type == 'int' and cond is None:
+        return series
+    return [condint(Decimal(x), to_type=to_type, cond=cond) for x in series]
 
 
 @stabilize
 def digital_root(n):
     n = abs(int(n))
-    while n >= 10:
-        n = sum(int(d) for d in str(n))
-    return n
+    # closed form: digit sums keep n mod 9
+    return 0 if n == 0 else 1 + (n - 1) % 9
 
 
 @stabilize
 def is_harshad(n):
     n = int(n)
-    return n % sum(int(d) for d in str(n)) == 0
+    return n % _digit_sum(abs(n)) == 0
 
 
 @stabilize
@@ -81,59 +142,77 @@ def collatz_steps(n):
     n = int(n)
     steps = 0
     while n != 1:
-        n = n // 2 if n % 2 == 0 else 3 * n + 1
+        n = 3 * n + 1 if n & 1 else n >> 1
         steps += 1
     return steps
 
 
 # ───────────── Roots & Powers ─────────────
 @stabilize
-def sqrt(x, *, to_type=None, cond=None):
+def sqrt(x, *, to_type=None, cond=None, fast=False):
+    if _use_fast(fast, x):
+        if x < 0:
+            raise ValueError("Cannot take square root of negative")
+        return condint(math.sqrt(x), to_type=to_type, cond=cond)
     x = _to_decimal(x)
     if x < 0:
         raise ValueError("Cannot take square root of negative")
-    guess = x / 2
-    for _ in range(30):
-        guess = (guess + dec_div(x, guess)) / 2
-    return condint(guess, to_type=to_type, cond=cond)
+    with localcontext() as ctx:
+        ctx.prec = max(SERIES_PREC, ctx.prec + 10)  # guard digits
+        guess = x / 2
+        for _ in range(30):
+            guess = (guess + dec_div(x, guess)) / 2
+    return condint(+guess, to_type=to_type, cond=cond)
 
 
 @stabilize
-def cbrt(x, *, to_type=None, cond=None):
+def cbrt(x, *, to_type=None, cond=None, fast=False):
+    if _use_fast(fast, x):
+        return condint(_cbrt_float(x), to_type=to_type, cond=cond)
     x = _to_decimal(x)
-    guess = x / 3
-    for _ in range(30):
-        guess = (2*guess + dec_div(x, guess*guess)) / 3
-    return condint(guess, to_type=to_type, cond=cond)
+    with localcontext() as ctx:
+        ctx.prec = max(SERIES_PREC, ctx.prec + 10)  # guard digits
+        guess = x / 3
+        for _ in range(30):
+            guess = (2*guess + dec_div(x, guess*guess)) / 3
+    return condint(+guess, to_type=to_type, cond=cond)
 
 
 @stabilize
 def power(base, exp, *, to_type=None, cond=None):
     base = _to_decimal(base)
     exp = int(exp)
-    result = ONE
-    for _ in range(abs(exp)):
-        result *= base
-    if exp < 0:
-        result = dec_div(ONE, result)
+    if exp == 0:
+        result = ONE  # Decimal raises on 0 ** 0
+    elif exp > 0:
+        result = base ** exp
+    else:
+        result = dec_div(ONE, base ** -exp)
     return condint(result, to_type=to_type, cond=cond)
 
 
 # ───────────── Logarithms ─────────────
 @stabilize
-def ln(x, *, to_type=None, cond=None):
+def ln(x, *, to_type=None, cond=None, fast=False):
+    if _use_fast(fast, x):
+        if x <= 0:
+            raise ValueError("ln undefined for non-positive numbers")
+        return condint(math.log(x), to_type=to_type, cond=cond)
     x = _to_decimal(x)
     if x <= 0:
         raise ValueError("ln undefined for non-positive numbers")
-    y = dec_div(x - ONE, x + ONE)
-    term = y
-    result = ZERO
-    n = 1
-    while abs(term) > Decimal("1e-40"):
-        result += dec_div(term, n)
-        term *= y * y
-        n += 2
-    return condint(2*result, to_type=to_type, cond=cond)
+    with localcontext() as ctx:
+        ctx.prec = max(SERIES_PREC, ctx.prec + 10)  # guard digits
+        y = dec_div(x - ONE, x + ONE)
+        term = y
+        result = ZERO
+        n = 1
+        while abs(term) > Decimal("1e-40"):
+            result += dec_div(term, n)
+            term *= y * y
+            n += 2
+        result = 2*result
+    return condint(+result, to_type=to_type, cond=cond)
 
 
 @stabilize
@@ -147,29 +226,37 @@ def log(x, base=10, *, to_type=None, cond=None):
 
 # ───────────── Trigonometry ─────────────
 @stabilize
-def sin(x, *, to_type=None, cond=None):
+def sin(x, *, to_type=None, cond=None, fast=False):
+    if _use_fast(fast, x):
+        return condint(math.sin(x), to_type=to_type, cond=cond)
     x = _to_decimal(x)
-    term = x
-    result = x
-    n = 1
-    while abs(term) > Decimal("1e-40"):
-        term *= -x*x / ((2*n)*(2*n+1))
-        result += term
-        n += 1
-    return condint(result, to_type=to_type, cond=cond)
+    with localcontext() as ctx:
+        ctx.prec = max(SERIES_PREC, ctx.prec + 10)  # guard digits
+        term = x
+        result = x
+        n = 1
+        while abs(term) > Decimal("1e-40"):
+            term *= -x*x / ((2*n)*(2*n+1))
+            result += term
+            n += 1
+    return condint(+result, to_type=to_type, cond=cond)
 
 
 @stabilize
-def cos(x, *, to_type=None, cond=None):
+def cos(x, *, to_type=None, cond=None, fast=False):
+    if _use_fast(fast, x):
+        return condint(math.cos(x), to_type=to_type, cond=cond)
     x = _to_decimal(x)
-    term = ONE
-    result = ONE
-    n = 1
-    while abs(term) > Decimal("1e-40"):
-        term *= -x*x / ((2*n-1)*(2*n))
-        result += term
-        n += 1
-    return condint(result, to_type=to_type, cond=cond)
+    with localcontext() as ctx:
+        ctx.prec = max(SERIES_PREC, ctx.prec + 10)  # guard digits
+        term = ONE
+        result = ONE
+        n = 1
+        while abs(term) > Decimal("1e-40"):
+            term *= -x*x / ((2*n-1)*(2*n))
+            result += term
+            n += 1
+    return condint(+result, to_type=to_type, cond=cond)
 
 
 @stabilize
@@ -183,7 +270,7 @@ def tan(x, *, to_type=None, cond=None):
 @stabilize
 def circumference(radius, *, to_type=None, cond=None):
     r = _to_decimal(radius)
-    return condint(2*PI*r, to_type=to_type, cond=cond)
+    return condint(TWO_PI*r, to_type=to_type, cond=cond)
 
 
 @stabilize
@@ -225,7 +312,9 @@ def perimeter_rectangle(length, breadth, *, to_type=None, cond=None):
 
 
 @stabilize
-def distance_2d(x1, y1, x2, y2, *, to_type=None, cond=None):
+def distance_2d(x1, y1, x2, y2, *, to_type=None, cond=None, fast=False):
+    if _use_fast(fast, x1, y1, x2, y2):
+        return condint(math.hypot(x2 - x1, y2 - y1), to_type=to_type, cond=cond)
     dx = _to_decimal(x2) - _to_decimal(x1)
     dy = _to_decimal(y2) - _to_decimal(y1)
     return condint(sqrt(dx*dx + dy*dy, to_type=to_type, cond=cond),
@@ -245,7 +334,9 @@ def cube_surface_area(side, *, to_type=None, cond=None):
 
 
 @stabilize
-def pythagoras(a, b, *, to_type=None, cond=None):
+def pythagoras(a, b, *, to_type=None, cond=None, fast=False):
+    if _use_fast(fast, a, b):
+        return condint(math.hypot(a, b), to_type=to_type, cond=cond)
     a = _to_decimal(a)
     b = _to_decimal(b)
     return condint(sqrt(a*a + b*b, to_type=to_type, cond=cond),
@@ -269,6 +360,8 @@ def simple_interest(principal, rate, time, *, to_type=None, cond=None):
 @stabilize
 def compound_interest(principal, rate, time, *, to_type=None, cond=None):
     p = _to_decimal(principal)
-    r = _to_decimal(rate)/100
+    r = _to_decimal(rate)/HUNDRED
     t = _to_decimal(time)
+    if t == t.to_integral_value():
+        t = int(t)  # integer power: exact repeated squaring, no exp/ln
     return condint(p*((ONE+r)**t)-p, to_type=to_type, cond=cond)
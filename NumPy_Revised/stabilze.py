@@ -1,29 +1,59 @@
-from functools import lru_cache
+from decimal import getcontext
+from functools import lru_cache, wraps
 
 class StabilizeError(Exception):
     """Raised when a stabilized function rule is violated."""
     pass
 
+def _hashable(args, kwargs):
+    try:
+        hash((args, tuple(kwargs.items())))
+    except TypeError:
+        return False
+    return True
+
 def stabilize(func):
     """
     Marks a function as stable, trustworthy, and safe.
-    Caches repeated calls for efficiency.
+    Caches repeated calls for efficiency (last 1024 distinct calls).
+    Calls with unhashable arguments (lists, arrays) simply skip the cache.
+    The Decimal precision and rounding are part of the key, since results
+    are rounded to the caller's context.
     """
-    cache = {}
+    @lru_cache(maxsize=1024, typed=True)
+    def cached(_prec, _rounding, *args, **kwargs):
+        return func(*args, **kwargs)
 
-    def wrapper(*args):
-        key = tuple(args)
-        if key in cache:
-            return cache[key]
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        ctx = getcontext()
         try:
-            result = func(*args)
+            try:
+                # the arguments are hashed once, by lru_cache itself
+                return cached(ctx.prec, ctx.rounding, *args, **kwargs)
+            except TypeError:
+                if _hashable(args, kwargs):
+                    raise  # a real TypeError from func
+                return func(*args, **kwargs)  # unhashable input, cannot be cached
         except ZeroDivisionError:
             raise StabilizeError("Cannot divide by zero. Please change the denominator.")
 
-        cache[key] = result
-        return result
+    wrapper.__stablised__ = True
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
+def _no_cache(func):
+    """
+    stabilize without the cache, for methods on mutable objects
+    (arrays) where a cached result could go stale.
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except ZeroDivisionError:
+            raise StabilizeError("Cannot divide by zero. Please change the denominator.")
 
     wrapper.__stablised__ = True
-    wrapper.__name__ = func.__name__
-    wrapper.__doc__ = func.__doc__
-    return wrapper   
\ No newline at end of file
+    return wrapper